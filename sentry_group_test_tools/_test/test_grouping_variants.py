@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
 
 import pytest
@@ -65,7 +66,24 @@ class GroupingInput:
 
 
 def grouping_input(data_path):
-    return [GroupingInput(filename) for filename in Path(data_path).glob("**/*.json")]
+    inputs = [GroupingInput(filename) for filename in Path(data_path).glob("**/*.json")]
+
+    schedule_path = os.environ.get("GROUPING_TEST_SCHEDULE_PATH")
+    if not schedule_path:
+        return inputs
+
+    # event_ids ordered longest-first; all configs of an event run on the same xdist worker
+    with open(schedule_path) as f:
+        schedule = json.load(f)
+    order = {event_id: i for i, event_id in enumerate(schedule)}
+    inputs.sort(key=lambda x: order.get(x.filename.stem, len(order)))
+
+    return [
+        pytest.param(x, marks=pytest.mark.xdist_group(x.filename.stem))
+        if x.filename.stem in order
+        else x
+        for x in inputs
+    ]
 
 
 def with_grouping_input(name, data_path):
@@ -79,6 +97,30 @@ class ReadableYamlDumper(yaml.dumper.SafeDumper):
         return True
 
 
+@pytest.fixture(autouse=True)
+def record_timing(request):
+    timings_path = os.environ.get("GROUPING_TEST_TIMINGS_PATH")
+    if not timings_path:
+        yield
+        return
+
+    start = time.time()
+    started = time.perf_counter()
+    yield
+    duration = time.perf_counter() - started
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    record = {
+        "event_id": request.node.callspec.params["grouping_input"].filename.stem,
+        "worker": worker,
+        "start": start,
+        "duration": duration,
+    }
+    # one file per worker, so parallel workers never write to the same file
+    with open(Path(timings_path, f"{worker}.jsonl"), "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
 def dump_variant(variant, lines=None, indent=0):
     if lines is None:
         lines = []
@@ -0,0 +1,105 @@
+import json
+import os
+import time
+from pathlib import Path
+from shutil import rmtree
+
+import click
+from sentry_group_test_tools.helpers import STORAGE_BACKENDS, Storage, get_backend
+
+BENCHMARK_DIR = Path("benchmark")
+
+
+class BenchmarkStorage(Storage):
+    # kept apart from the real cache, so benchmarking never touches cached events
+    ROOT_NAME = Path("grouping_storage_bench")
+
+
+def make_event(event_id: int, size: int) -> dict:
+    # roughly the shape of an input event, padded with frames up to `size` bytes
+    frame = {"function": "handler", "module": "app.views", "lineno": 42, "in_app": True}
+    n_frames = max(1, size // len(json.dumps(frame)))
+    return {
+        "event_id": f"{event_id:032x}",
+        "platform": "python",
+        "exception": {
+            "values": [{"type": "Exception", "stacktrace": {"frames": [frame] * n_frames}}]
+        },
+    }
+
+
+def report(label: str, n_files: int, n_bytes: int, elapsed: float) -> None:
+    throughput = f"{n_files / elapsed:10.0f} files/s"
+    if n_bytes:
+        throughput += f"  {n_bytes / elapsed / 1024 / 1024:8.1f} MB/s"
+    click.secho(f"{label:>17}: {throughput}  ({elapsed:.3f}s)", fg="cyan")
+
+
+@click.command()
+@click.option(
+    "--storage",
+    "storage_backend",
+    type=click.Choice(list(STORAGE_BACKENDS)),
+    default="local",
+    help="storage backend to benchmark",
+)
+@click.option(
+    "--storage-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="base directory for the storage backend (eg. /dev/shm for ram)",
+)
+@click.option("--events", "-n", default=1000, help="number of files to write", type=int)
+@click.option("--event-size", "-s", default=30_000, help="approximate file size in bytes", type=int)
+@click.option(
+    "--fsync", help="fsync every file, the tool itself never does", type=bool, is_flag=True
+)
+def main(storage_backend: str, storage_dir: Path | None, events: int, event_size: int, fsync: bool):
+    storage = BenchmarkStorage(limit=events, backend=get_backend(storage_backend, storage_dir))
+    bench_dir = storage.ensure_path(BENCHMARK_DIR)
+    payloads = [json.dumps(make_event(i, event_size)) for i in range(events)]
+    n_bytes = sum(len(payload) for payload in payloads)
+
+    try:
+        start = time.perf_counter()
+        for i, payload in enumerate(payloads):
+            with open(bench_dir / f"{i}.json", "w") as f:
+                f.write(payload)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        report("write + fsync" if fsync else "write", events, n_bytes, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        contents = []
+        for json_file in bench_dir.glob("*.json"):
+            with open(json_file) as f:
+                contents.append(f.read())
+        # files were just written, so this measures the page cache on disk-backed storage
+        report("read (warm cache)", events, n_bytes, time.perf_counter() - start)
+
+        # not storage bound, reported separately as it is the same for every backend
+        start = time.perf_counter()
+        for content in contents:
+            json.loads(content)
+        report("json parse", events, n_bytes, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for json_file in bench_dir.glob("*.json"):
+            json_file.unlink()
+        report("delete", events, 0, time.perf_counter() - start)
+    finally:
+        if storage_backend == "edmg":
+            rmtree(bench_dir, ignore_errors=True)
+        else:
+            storage.backend.wipe(storage.root_path)
+
+    if storage_backend == "edmg":
+        click.secho(
+            f"edmgutil volume kept at {storage.root_path}, "
+            f"run `edmgutil eject {storage.root_path}` to remove it",
+            fg="yellow",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
 import os
+import re
 import subprocess
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
+from shutil import rmtree
 from subprocess import check_output
 import contextlib
 
 import click
-from sentry_group_test_tools.helpers import Data, Storage, compare_all
+from sentry_group_test_tools.helpers import (
+    STORAGE_BACKENDS,
+    Data,
+    Storage,
+    build_schedule,
+    compare_all,
+    get_backend,
+    print_utilization,
+    record_timings,
+)
 
 os.environ["SENTRY_IN_TEST_ENVIRONMENT"] = "1"
 
@@ -21,7 +33,26 @@ MASTER = "master"
 @click.option("--token", "-t", help="API token", default=TOKEN)
 @click.option("--force-refetch", "-f", help="force refetching data", type=bool, is_flag=True)
 @click.option("--force-baseline", help="force rerunning of baseline tests", type=bool, is_flag=True)
+@click.option("--wipe", help="wipe all cached data and exit", type=bool, is_flag=True)
 @click.option("--grouping-config", help="grouping config IDs (eg. newstyle:2023_01_11)")
+@click.option(
+    "--storage",
+    "storage_backend",
+    type=click.Choice(list(STORAGE_BACKENDS)),
+    default="edmg",
+    help="storage backend for cached data",
+)
+@click.option(
+    "--storage-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="base directory for the storage backend (eg. /dev/shm for ram)",
+)
+@click.option(
+    "--workers",
+    "-n",
+    help="number of test workers [default: all cores]",
+    type=click.IntRange(min=1),
+)
 def main(
     org: str,
     project: str,
@@ -30,9 +61,17 @@ def main(
     token: str,
     force_refetch: bool,
     force_baseline: bool,
+    wipe: bool,
     grouping_config: str,
+    storage_backend: str,
+    storage_dir: Path | None,
+    workers: int | None,
 ):
-    storage = Storage(limit=limit)
+    storage = Storage(limit=limit, backend=get_backend(storage_backend, storage_dir))
+
+    if wipe:
+        storage.wipe_data()
+        return
 
     if force_refetch:
         # this will wipe all data
@@ -49,8 +88,8 @@ def main(
         data.read_raw_data()
 
     data.transform_data()
-    run_baseline_tests(storage, force_baseline, grouping_config)
-    run_new_tests(storage, grouping_config)
+    run_baseline_tests(storage, force_baseline, workers, grouping_config)
+    run_new_tests(storage, workers, grouping_config)
     compare_all(storage)
 
 def sentry_root() -> Path:
@@ -73,7 +112,22 @@ def git(command: str, splitlines: bool=False) -> str | list[str]:
     else:
         return output.strip()
 
-def run_baseline_tests(storage: Storage, force_baseline: bool, grouping_config: str| None = None) -> None:
+def xdist_keep_order_args() -> list[str]:
+    # xdist re-sorts groups by number of tests by default; every event has the same number of
+    # tests so the (stable) sort keeps our order, but be explicit where xdist supports it
+    try:
+        xdist_version = version("pytest-xdist")
+    except PackageNotFoundError:
+        return []
+
+    match = re.match(r"(\d+)\.(\d+)", xdist_version)
+    if match and (int(match[1]), int(match[2])) >= (3, 8):
+        return ["--no-loadscope-reorder"]
+    return []
+
+def run_baseline_tests(
+    storage: Storage, force_baseline: bool, workers: int | None, grouping_config: str | None = None
+) -> None:
     if not force_baseline and not storage.empty(storage.baseline_outputs_dir, glob="**/*.txt"):
         click.secho("Baseline tests already ran, skipping", fg="green", nl=False)
         click.secho(" [use --force-baseline to force refresh]", fg="yellow")
@@ -96,15 +150,15 @@ def run_baseline_tests(storage: Storage, force_baseline: bool, grouping_config:
 
     try:
         git(f"switch {MASTER}")
-        run_tests(storage.inputs_dir, storage.baseline_outputs_dir, grouping_config)
+        run_tests(storage, storage.baseline_outputs_dir, workers, grouping_config)
     finally:
         git(f"switch {BRANCH}")
         if stash_id:
             git(f"stash pop {stash_id}")
 
 
-def run_new_tests(storage: Storage, grouping_config: str| None = None) -> None:
-    run_tests(storage.inputs_dir, storage.new_outputs_dir, grouping_config)
+def run_new_tests(storage: Storage, workers: int | None, grouping_config: str | None = None) -> None:
+    run_tests(storage, storage.new_outputs_dir, workers, grouping_config)
 
 @contextlib.contextmanager
 def symlinked_test_dir():
@@ -118,10 +172,16 @@ def symlinked_test_dir():
         test_link.unlink()
 
 @symlinked_test_dir()
-def run_tests(input_dir, ouput_dir, grouping_config: str| None = None):
+def run_tests(storage: Storage, ouput_dir: Path, workers: int | None, grouping_config: str | None = None):
     # calling via subprocess to avoid pytest's internal caching, which gets confused
     # by the code changing between runs
 
+    # events are dispatched one at a time, longest-first, see `build_schedule`
+    schedule_path = build_schedule(storage)
+    timings_dir = storage.timings_dir / ouput_dir.name
+    rmtree(timings_dir, ignore_errors=True)
+    timings_dir.mkdir()
+
     pytest_cwd = sentry_root()
 
     pytest_command = [
@@ -139,15 +199,18 @@ def run_tests(input_dir, ouput_dir, grouping_config: str| None = None):
         "-p",
         "no:rerunfailures",  # doesn't work well with parallel, but we don't need it
         "--no-cov",
-        "--dist=load",  # run tests in parallel using all available cores
+        "--dist=loadgroup",  # run scheduled events in parallel, in collection order
         "-n",
-        "auto",
+        "auto" if workers is None else str(workers),
+        *xdist_keep_order_args(),
     ]
 
     pytest_env = {
         **os.environ,
-        "GROUPING_TEST_INPUT_PATH": str(input_dir),
+        "GROUPING_TEST_INPUT_PATH": str(storage.inputs_dir),
         "GROUPING_TEST_OUTPUT_PATH": str(ouput_dir),
+        "GROUPING_TEST_SCHEDULE_PATH": str(schedule_path),
+        "GROUPING_TEST_TIMINGS_PATH": str(timings_dir),
     }
 
     try:
@@ -179,6 +242,10 @@ def run_tests(input_dir, ouput_dir, grouping_config: str| None = None):
             if b"PASSED" in line:
                 bar.update(1)
 
+    process.wait()
+    record_timings(storage, timings_dir)
+    print_utilization(timings_dir)
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,18 @@
 from .compare import CompareConfigOutputs, compare_all
 from .data import Data
-from .storage import Storage
+from .schedule import CostModel, build_schedule, print_utilization, record_timings
+from .storage import STORAGE_BACKENDS, Storage, StorageBackend, get_backend
 
-__all__ = ["Storage", "Data", "CompareConfigOutputs", "compare_all"]
+__all__ = [
+    "Storage",
+    "StorageBackend",
+    "STORAGE_BACKENDS",
+    "get_backend",
+    "Data",
+    "CompareConfigOutputs",
+    "compare_all",
+    "CostModel",
+    "build_schedule",
+    "record_timings",
+    "print_utilization",
+]
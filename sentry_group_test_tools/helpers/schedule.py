@@ -0,0 +1,166 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+
+import click
+
+from .storage import Storage
+
+def event_features(path: Path) -> tuple[float, float, float]:
+    # payload size (KB), frame count, exception count
+    with open(path) as f:
+        event = json.load(f)
+
+    exceptions = (event.get("exception") or {}).get("values") or []
+    frames = 0
+    for exception in exceptions:
+        stacktrace = (exception or {}).get("stacktrace") or {}
+        frames += len(stacktrace.get("frames") or [])
+
+    return path.stat().st_size / 1024, float(frames), float(len(exceptions))
+
+
+def solve(matrix: list[list[float]], vector: list[float]) -> list[float]:
+    # gaussian elimination with partial pivoting, the system is tiny (4x4)
+    n = len(vector)
+    rows = [row[:] + [value] for row, value in zip(matrix, vector)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        if rows[col][col] == 0:
+            raise ValueError("Singular matrix")
+        for r in range(col + 1, n):
+            factor = rows[r][col] / rows[col][col]
+            for c in range(col, n + 1):
+                rows[r][c] -= factor * rows[col][c]
+
+    result = [0.0] * n
+    for r in reversed(range(n)):
+        acc = sum(rows[r][c] * result[c] for c in range(r + 1, n))
+        result[r] = (rows[r][n] - acc) / rows[r][r]
+    return result
+
+
+class CostModel:
+    # seconds per test: intercept, per KB of payload, per frame, per exception
+    DEFAULT_COEFFICIENTS = (0.05, 0.001, 0.002, 0.01)
+    MIN_SAMPLES = 10
+    MIN_COST = 1e-4
+    RIDGE = 1e-6
+
+    def __init__(self, coefficients: tuple[float, ...] | None = None) -> None:
+        self.coefficients = tuple(coefficients or self.DEFAULT_COEFFICIENTS)
+        self.calibrated = coefficients is not None
+
+    @classmethod
+    def calibrate(cls, samples: list[tuple[tuple[float, ...], float]]) -> "CostModel":
+        if len(samples) < cls.MIN_SAMPLES:
+            return cls()
+
+        rows = [(1.0, *features) for features, _ in samples]
+        n = len(rows[0])
+        xtx = [[sum(row[i] * row[j] for row in rows) for j in range(n)] for i in range(n)]
+        xty = [sum(row[i] * seconds for row, (_, seconds) in zip(rows, samples)) for i in range(n)]
+        for i in range(n):
+            xtx[i][i] += cls.RIDGE * len(rows)
+
+        try:
+            coefficients = solve(xtx, xty)
+        except ValueError:
+            return cls()
+        # a feature can't make an event cheaper, negative weights are fitting noise
+        return cls(tuple(max(0.0, c) for c in coefficients))
+
+    def cost(self, features: tuple[float, ...]) -> float:
+        intercept, *weights = self.coefficients
+        return max(self.MIN_COST, intercept + sum(w * f for w, f in zip(weights, features)))
+
+
+def load_timings(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def longest_first(costs: dict[str, float]) -> list[str]:
+    # every event is its own dispatch unit, so the units handed out last are also the smallest;
+    # ties are broken by event_id to keep the order stable between runs
+    return sorted(costs, key=lambda event_id: (-costs[event_id], event_id))
+
+
+def build_schedule(storage: Storage) -> Path:
+    timings = load_timings(storage.timings_path)
+    features = {path.stem: event_features(path) for path in storage.inputs_dir.glob("**/*.json")}
+
+    model = CostModel.calibrate(
+        [(features[event_id], seconds) for event_id, seconds in timings.items() if event_id in features]
+    )
+    # measured timings are more accurate than any estimate, the model only covers unseen events
+    costs = {
+        event_id: timings[event_id] if event_id in timings else model.cost(f)
+        for event_id, f in features.items()
+    }
+    schedule = longest_first(costs)
+    with open(storage.schedule_path, "w") as f:
+        json.dump(schedule, f)
+
+    n_measured = sum(1 for event_id in features if event_id in timings)
+    source = "calibrated" if model.calibrated else "default"
+    click.secho(
+        f"Scheduled {len(schedule)} events longest-first "
+        f"({n_measured} measured, {len(schedule) - n_measured} estimated by {source} cost model)",
+        fg="green",
+    )
+    return storage.schedule_path
+
+
+def read_timing_records(timings_dir: Path) -> list[dict]:
+    records = []
+    for records_file in timings_dir.glob("*.jsonl"):
+        with open(records_file) as f:
+            records += [json.loads(line) for line in f if line.strip()]
+    return records
+
+
+def record_timings(storage: Storage, timings_dir: Path) -> None:
+    # mean per-test duration of each event, used to calibrate the cost model on the next run
+    per_event = defaultdict(list)
+    for record in read_timing_records(timings_dir):
+        per_event[record["event_id"]].append(record["duration"])
+    if not per_event:
+        return
+
+    timings = load_timings(storage.timings_path)
+    timings.update({event_id: sum(d) / len(d) for event_id, d in per_event.items()})
+    with open(storage.timings_path, "w") as f:
+        json.dump(timings, f)
+
+
+def print_utilization(timings_dir: Path) -> None:
+    records = read_timing_records(timings_dir)
+    if not records:
+        return
+
+    start = min(r["start"] for r in records)
+    end = max(r["start"] + r["duration"] for r in records)
+    wall = max(end - start, 1e-9)
+
+    workers = defaultdict(list)
+    for record in records:
+        workers[record["worker"]].append(record)
+
+    finished = {}
+    click.secho(f"Worker utilization over {wall:.1f}s:", bold=True)
+    for worker, worker_records in sorted(workers.items()):
+        busy = sum(r["duration"] for r in worker_records)
+        finished[worker] = max(r["start"] + r["duration"] for r in worker_records) - start
+        utilization = busy / wall
+        click.secho(
+            f" - {worker}: {utilization:6.1%} busy, {len(worker_records)} tests, "
+            f"done at {finished[worker]:.1f}s",
+            fg="green" if utilization >= 0.9 else "yellow",
+        )
+
+    tail = max(finished.values()) - min(finished.values())
+    click.secho(f"Tail (first to last worker done): {tail:.1f}s", fg="cyan")
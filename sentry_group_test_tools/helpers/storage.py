@@ -1,3 +1,4 @@
+from abc import ABC, abstractmethod
 from pathlib import Path
 from shutil import rmtree, which
 from subprocess import check_call
@@ -5,33 +6,146 @@ from subprocess import check_call
 import click
 
 
-class Storage:
-    ROOT_NAME = Path("grouping_data_cache")
-    EDMG_BASE = Path("/Volumes")
-    EDMG_MIN_SIZE = 100  # 100MB
-    EDMG_EXPIRY = 7  # 7 days expiry, max allowed is 14 days
+class StorageBackend(ABC):
+    NAME = ""
+    DEFAULT_BASE: Path
 
-    def __init__(self, limit: int) -> None:
-        if not self.ensure_edmg():
-            raise Exception("Encrypted storage required for this tool")
-        self.base = self.EDMG_BASE
-        self._root = self.base / self.ROOT_NAME
+    def __init__(self, base: Path | None = None) -> None:
+        self.base = Path(base) if base is not None else self.DEFAULT_BASE
 
-        # keeping this small makes it faster to eject and re-create
-        self.EDMG_SIZE = max(self.EDMG_MIN_SIZE, int(limit * .3) + 100)  # 300KB per event
+    def ensure_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def create_root(self, root: Path, limit: int) -> None: ...
+
+    @abstractmethod
+    def wipe(self, root: Path) -> None: ...
 
 
-    def ensure_edmg(self) -> bool:
+class EdmgBackend(StorageBackend):
+    NAME = "edmg"
+    DEFAULT_BASE = Path("/Volumes")
+    EDMG_MIN_SIZE = 100  # 100MB
+    EDMG_EXPIRY = 7  # 7 days expiry, max allowed is 14 days
+
+    def __init__(self, base: Path | None = None) -> None:
+        # edmgutil always mounts its volumes in /Volumes, any other base would end up
+        # as a plain, non-encrypted directory
+        if base is not None and Path(base) != self.DEFAULT_BASE:
+            raise click.BadParameter(
+                f"edmgutil volumes are always mounted in {self.DEFAULT_BASE}",
+                param_hint="'--storage-dir'",
+            )
+        super().__init__(base)
+
+    def ensure_available(self) -> bool:
         if which("edmgutil"):
             return True
 
-        click.secho("⚠️ edmgutil not found, falling back to non-encrypted storage!", fg="red")
+        click.secho("⚠️ edmgutil not found, encrypted storage is not available!", fg="red")
         click.secho("Please install edmutils https://github.com/getsentry/edmgutil", fg="yellow")
         click.secho(
             "Make sure to enable `edmgutil cron --install` to auto-eject expired data", fg="yellow"
         )
+        click.secho(
+            "Or use `--storage local` or `--storage ram` for non-encrypted storage", fg="yellow"
+        )
         return False
 
+    def create_root(self, root: Path, limit: int) -> None:
+        click.secho(f"Using encrypted, ephemeral storage", fg="green")
+        try:
+            check_call(["edmgutil", "eject", "--expired"])
+        except Exception as e:
+            click.secho(f"⚠️ Failed to eject expired data: {e}", fg="red")
+            raise
+
+        if root.exists():
+            return
+
+        # keeping this small makes it faster to eject and re-create
+        size = max(self.EDMG_MIN_SIZE, int(limit * 0.3) + 100)  # 300KB per event
+        try:
+            check_call(
+                [
+                    "edmgutil",
+                    "new",
+                    f"--size={size}",
+                    f"--name={root.name}",
+                    f"--days={self.EDMG_EXPIRY}",
+                ]
+            )
+        except Exception as e:
+            click.secho(f"⚠️ Failed to create edmgutil storage: {e}", fg="red")
+            raise
+
+    def wipe(self, root: Path) -> None:
+        try:
+            check_call(["edmgutil", "eject", str(root)])
+            # ejecting and re-creating is faster, and refreshes expiry
+        except Exception as e:
+            click.secho(f"⚠️ Failed to eject edmgutil storage: {e}", fg="red")
+            raise
+
+
+class LocalBackend(StorageBackend):
+    NAME = "local"
+    DEFAULT_BASE = Path.home() / ".cache"
+
+    def ensure_available(self) -> bool:
+        click.secho("⚠️ Using non-encrypted storage, remember to wipe it with --wipe", fg="yellow")
+        return True
+
+    def create_root(self, root: Path, limit: int) -> None:
+        click.secho(f"Using local storage in {root}", fg="green")
+        root.mkdir(parents=True, exist_ok=True)
+
+    def wipe(self, root: Path) -> None:
+        rmtree(root)
+
+
+class RamBackend(LocalBackend):
+    NAME = "ram"
+    DEFAULT_BASE = Path("/dev/shm")
+
+    def ensure_available(self) -> bool:
+        if not self.base.is_dir():
+            click.secho(f"⚠️ {self.base} not found, RAM-backed storage is not available", fg="red")
+            return False
+        click.secho(
+            "⚠️ Using non-encrypted storage, data is lost on reboot or wipe it with --wipe",
+            fg="yellow",
+        )
+        return True
+
+    def create_root(self, root: Path, limit: int) -> None:
+        click.secho(f"Using RAM-backed, ephemeral storage in {root}", fg="green")
+        root.mkdir(parents=True, exist_ok=True)
+
+
+STORAGE_BACKENDS = {
+    backend.NAME: backend for backend in (EdmgBackend, LocalBackend, RamBackend)
+}
+
+
+def get_backend(name: str, base: Path | None = None) -> StorageBackend:
+    return STORAGE_BACKENDS[name](base)
+
+
+class Storage:
+    ROOT_NAME = Path("grouping_data_cache")
+
+    def __init__(self, limit: int, backend: StorageBackend | None = None) -> None:
+        self.backend = backend or EdmgBackend()
+        if not self.backend.ensure_available():
+            if isinstance(self.backend, EdmgBackend):
+                raise Exception("Encrypted storage required for this tool")
+            raise Exception(f"Storage backend '{self.backend.NAME}' is not available")
+        self.base = self.backend.base
+        self.limit = limit
+        self._root = self.base / self.ROOT_NAME
+
     @property
     def root(self) -> Path:
         if not self._root.exists():
@@ -47,39 +161,13 @@ class Storage:
         return hasattr(self, "_root") and self._root.exists()
 
     def create_root(self) -> Path:
-        click.secho(f"Using encrypted, ephemeral storage", fg="green")
-        try:
-            check_call(["edmgutil", "eject", "--expired"])
-        except Exception as e:
-            click.secho(f"⚠️ Failed to eject expired data: {e}", fg="red")
-            raise
-
-        if not self._root.exists():
-            try:
-                check_call(
-                    [
-                        "edmgutil",
-                        "new",
-                        f"--size={self.EDMG_SIZE}",
-                        f"--name={self.ROOT_NAME}",
-                        f"--days={self.EDMG_EXPIRY}",
-                    ]
-                )
-            except Exception as e:
-                click.secho(f"⚠️ Failed to create edmgutil storage: {e}", fg="red")
-                raise
+        self.backend.create_root(self._root, self.limit)
         return self._root
 
-
     def wipe_data(self) -> None:
         if not self._root_exists:
             return
-        try:
-            check_call(["edmgutil", "eject", str(self.root)])
-            # ejecting and re-creating is faster, and refreshes expiry
-        except Exception as e:
-            click.secho(f"⚠️ Failed to eject edmgutil storage: {e}", fg="red")
-            raise
+        self.backend.wipe(self.root)
 
         click.secho("Cache cleared", fg="yellow")
 
@@ -110,5 +198,17 @@ class Storage:
     def new_outputs_dir(self) -> Path:
         return self.ensure_path("new_outputs")
 
+    @property
+    def timings_dir(self) -> Path:
+        return self.ensure_path("timings")
+
+    @property
+    def timings_path(self) -> Path:
+        return self.base_data_dir / "timings.json"
+
+    @property
+    def schedule_path(self) -> Path:
+        return self.base_data_dir / "schedule.json"
+
     def empty(self, path: Path, glob: str = "*.json") -> bool:
         return not any(path.glob(glob))
@@ -0,0 +1,15 @@
+from click.testing import CliRunner
+
+from sentry_group_test_tools.benchmark import main
+
+
+def test_benchmark_local(tmp_path):
+    result = CliRunner().invoke(
+        main, ["--storage", "local", "--storage-dir", str(tmp_path), "-n", "5", "-s", "1000"]
+    )
+
+    assert result.exit_code == 0, result.output
+    for label in ("write", "read (warm cache)", "json parse", "delete"):
+        assert f"{label}:" in result.output
+    # the benchmark root is removed, and nothing else is left behind
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,16 @@
+from click.testing import CliRunner
+
+from sentry_group_test_tools.cli import main
+from sentry_group_test_tools.helpers import Storage
+
+
+def test_wipe(tmp_path):
+    root = tmp_path / Storage.ROOT_NAME
+    (root / "data" / "raw").mkdir(parents=True)
+    (root / "data" / "raw" / "event.json").write_text("{}")
+
+    result = CliRunner().invoke(main, ["--storage", "local", "--storage-dir", str(tmp_path), "--wipe"])
+
+    assert result.exit_code == 0, result.output
+    assert "Cache cleared" in result.output
+    assert not root.exists()
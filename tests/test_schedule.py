@@ -0,0 +1,164 @@
+import json
+from importlib.metadata import PackageNotFoundError
+
+import pytest
+
+from sentry_group_test_tools import cli
+from sentry_group_test_tools.helpers import (
+    CostModel,
+    Storage,
+    build_schedule,
+    get_backend,
+    print_utilization,
+)
+from sentry_group_test_tools.helpers.schedule import (
+    longest_first,
+    event_features,
+    record_timings,
+)
+
+
+def make_event(event_id, n_exceptions, n_frames):
+    frames = [{"function": "f", "lineno": i} for i in range(n_frames)]
+    values = [{"type": "Error", "stacktrace": {"frames": frames}} for _ in range(n_exceptions)]
+    return {"event_id": event_id, "exception": {"values": values}}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return Storage(limit=10, backend=get_backend("local", tmp_path))
+
+
+def test_event_features(tmp_path):
+    path = tmp_path / "event.json"
+    path.write_text(json.dumps(make_event("a", 2, 5)))
+
+    size, frames, exceptions = event_features(path)
+    assert size == path.stat().st_size / 1024
+    assert (frames, exceptions) == (10, 2)
+
+
+def test_event_features_without_stacktrace(tmp_path):
+    path = tmp_path / "event.json"
+    path.write_text(json.dumps({"event_id": "a", "exception": {"values": [{"stacktrace": None}]}}))
+
+    assert event_features(path)[1:] == (0, 1)
+
+
+def test_event_features_without_exception(tmp_path):
+    path = tmp_path / "event.json"
+    path.write_text(json.dumps({"event_id": "a", "message": "hello"}))
+
+    assert event_features(path)[1:] == (0, 0)
+
+
+def test_calibrate():
+    true_model = CostModel((0.1, 0.01, 0.003, 0.05))
+    features = [(float(i), float(i * 7 % 13), float(i % 4)) for i in range(20)]
+    model = CostModel.calibrate([(f, true_model.cost(f)) for f in features])
+
+    assert model.calibrated
+    assert model.coefficients == pytest.approx(true_model.coefficients, abs=1e-3)
+
+
+def test_calibrate_not_enough_samples():
+    model = CostModel.calibrate([((1.0, 1.0, 1.0), 1.0)])
+
+    assert not model.calibrated
+    assert model.coefficients == CostModel.DEFAULT_COEFFICIENTS
+
+
+def test_longest_first():
+    costs = {"huge": 8.0, "big": 6.0, **{f"small{i}": 1.0 for i in range(8)}}
+    order = longest_first(costs)
+
+    # dispatch units shrink towards the end, so the last ones handed out are the cheapest
+    assert [costs[event_id] for event_id in order] == sorted(costs.values(), reverse=True)
+    assert order[:2] == ["huge", "big"]
+    assert sorted(order) == sorted(costs)
+
+
+def test_longest_first_ties_are_stable():
+    costs = {"c": 1.0, "a": 1.0, "b": 2.0}
+    assert longest_first(costs) == ["b", "a", "c"]
+
+
+def test_build_schedule(storage):
+    for event_id, n_frames in [("short", 1), ("long", 500), ("medium", 50)]:
+        with open(storage.inputs_dir / f"{event_id}.json", "w") as f:
+            json.dump(make_event(event_id, 1, n_frames), f)
+
+    build_schedule(storage)
+    with open(storage.schedule_path) as f:
+        assert json.load(f) == ["long", "medium", "short"]
+
+
+def test_build_schedule_prefers_measured_timings(storage):
+    for event_id, n_frames in [("short", 1), ("long", 500), ("medium", 50)]:
+        with open(storage.inputs_dir / f"{event_id}.json", "w") as f:
+            json.dump(make_event(event_id, 1, n_frames), f)
+    # "short" turned out to be the slowest one, "long" was never measured
+    with open(storage.timings_path, "w") as f:
+        json.dump({"short": 10.0, "medium": 0.001}, f)
+
+    build_schedule(storage)
+    with open(storage.schedule_path) as f:
+        assert json.load(f) == ["short", "long", "medium"]
+
+
+def test_record_timings(storage):
+    timings_dir = storage.timings_dir / "new_outputs"
+    timings_dir.mkdir()
+    records = [
+        {"event_id": "a", "worker": "gw0", "start": 0.0, "duration": 1.0},
+        {"event_id": "a", "worker": "gw1", "start": 0.0, "duration": 3.0},
+        {"event_id": "b", "worker": "gw0", "start": 1.0, "duration": 0.5},
+    ]
+    with open(timings_dir / "gw0.jsonl", "w") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+
+    record_timings(storage, timings_dir)
+    with open(storage.timings_path) as f:
+        assert json.load(f) == {"a": 2.0, "b": 0.5}
+
+
+def test_print_utilization(tmp_path, capsys):
+    records = {
+        "gw0": [(100.0, 4.0), (104.0, 4.0)],
+        "gw1": [(100.0, 2.0), (102.0, 2.0)],
+    }
+    for worker, spans in records.items():
+        with open(tmp_path / f"{worker}.jsonl", "w") as f:
+            for start, duration in spans:
+                record = {"event_id": "a", "worker": worker, "start": start, "duration": duration}
+                f.write(json.dumps(record) + "\n")
+
+    print_utilization(tmp_path)
+    output = capsys.readouterr().out
+
+    assert "Worker utilization over 8.0s" in output
+    assert "gw0: 100.0% busy, 2 tests, done at 8.0s" in output
+    assert "gw1:  50.0% busy, 2 tests, done at 4.0s" in output
+    assert "Tail (first to last worker done): 4.0s" in output
+
+
+def test_print_utilization_without_records(tmp_path, capsys):
+    print_utilization(tmp_path)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    "xdist_version, expected",
+    [("3.7.0", []), ("3.8.0", ["--no-loadscope-reorder"]), ("4.0.1", ["--no-loadscope-reorder"])],
+)
+def test_xdist_keep_order_args(monkeypatch, xdist_version, expected):
+    monkeypatch.setattr(cli, "version", lambda name: xdist_version)
+    assert cli.xdist_keep_order_args() == expected
+
+
+def test_xdist_keep_order_args_without_xdist(monkeypatch):
+    def version(name):
+        raise PackageNotFoundError(name)
+
+    monkeypatch.setattr(cli, "version", version)
+    assert cli.xdist_keep_order_args() == []
@@ -0,0 +1,42 @@
+import click
+import pytest
+
+from sentry_group_test_tools.helpers import STORAGE_BACKENDS, Storage, StorageBackend, get_backend
+
+
+@pytest.mark.parametrize("backend_name", ["local", "ram"])
+def test_directory_backends(tmp_path, backend_name):
+    storage = Storage(limit=10, backend=get_backend(backend_name, tmp_path))
+
+    assert storage.root == tmp_path / Storage.ROOT_NAME
+    assert storage.empty(storage.raw_data_dir)
+
+    (storage.raw_data_dir / "event.json").write_text("{}")
+    assert not storage.empty(storage.raw_data_dir)
+
+    storage.wipe_data()
+    assert not storage.root_path.exists()
+    assert storage.empty(storage.raw_data_dir)
+
+
+def test_unavailable_backend(tmp_path):
+    with pytest.raises(Exception, match="not available"):
+        Storage(limit=10, backend=get_backend("ram", tmp_path / "missing"))
+
+
+def test_backend_names():
+    assert set(STORAGE_BACKENDS) == {"edmg", "local", "ram"}
+
+
+def test_edmg_rejects_custom_base(tmp_path):
+    with pytest.raises(click.BadParameter):
+        get_backend("edmg", tmp_path)
+
+
+def test_backend_must_implement_abstract_methods():
+    class IncompleteBackend(StorageBackend):
+        def create_root(self, root, limit):
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()